@@ -1,11 +1,13 @@
 """Generate ``click`` commands from function docstrings."""
 
 import io
+import sys
 import uuid
 import enum
 import inspect
 import pathlib
 import datetime
+import importlib
 import typing as t
 import logging as lg
 import functools as ft
@@ -191,6 +193,108 @@ def _get_param_decorator(
         raise ValueError(param.kind)
 
 
+def _call_var_args(*plan, **params):
+    """Call function, passing parsed parameters as variadic positional args.
+
+    Args:
+        plan: function to call, parameters passed positionally, and parameter
+            passed as variadic positional arguments
+        params: parsed parameters
+    """
+
+    fn, positional, var_positional = plan
+    pop = params.pop
+    if not positional:
+        return fn(*pop(var_positional, ()), **params)
+    args = (*map(pop, positional), *pop(var_positional, ()))
+    return fn(*args, **params)
+
+
+def _call_positional(*plan, **params):
+    """Call function, passing positional-only parsed parameters positionally.
+
+    Args:
+        plan: function to call, and parameters passed positionally
+        params: parsed parameters
+    """
+
+    fn, positional = plan
+    args = tuple(map(params.pop, positional))
+    return fn(*args, **params)
+
+
+def _drop_unset_kwargs(*plan, **params):
+    """Call callback, leaving out variadic keyword arguments not provided.
+
+    Args:
+        plan: callback, and single-value and multiple-value parameters
+            passed as variadic keyword arguments
+        params: parsed parameters
+    """
+
+    callback, kwargs_single, kwargs_multiple = plan
+    for name in kwargs_single:
+        if params.get(name) is None:
+            params.pop(name, None)
+    for name in kwargs_multiple:
+        if params.get(name, ()) == ():
+            params.pop(name, None)
+    return callback(**params)
+
+
+def _get_attribute(obj: t.Any, qualname: str) -> t.Any:
+    """Get (nested) attribute by qualified name."""
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def _load_command(module_name: str, qualname: str) -> click.Command:
+    """Get command defined at module-level."""
+    return _get_attribute(importlib.import_module(module_name), qualname)
+
+
+def _new_command(command_class: t.Type[click.Command]) -> click.Command:
+    """Create uninitialised command, to be unpickled."""
+    cls = _get_command_class(command_class)
+    return cls.__new__(cls)
+
+
+class _Command:
+    """Command mixin, pickling by reference when defined at module-level.
+
+    Decorating a function in-place shadows its name with the command, so the
+    function can't be pickled by reference.
+
+    Attributes:
+        command_class: ``click`` command class
+    """
+
+    command_class = click.Command  # type: t.Type[click.Command]
+
+    def __reduce_ex__(self, protocol):
+        fn = getattr(self.callback, "__wrapped__", self.callback)
+        module = sys.modules.get(getattr(fn, "__module__", None))
+        qualname = getattr(fn, "__qualname__", "")
+        try:
+            obj = _get_attribute(module, qualname)
+        except AttributeError:
+            obj = None
+        if module is not None and obj is self:
+            return _load_command, (module.__name__, qualname)
+        reduced = super().__reduce_ex__(protocol)
+        return (_new_command, (self.command_class,)) + tuple(reduced[2:])
+
+
+@ft.lru_cache(maxsize=None)
+def _get_command_class(
+        command_class: t.Type[click.Command],
+) -> t.Type[click.Command]:
+    """Subclass command class to pickle by reference when defined at module-level."""
+    attrs = {"__module__": __name__, "command_class": command_class}
+    return type(command_class.__name__, (_Command, command_class), attrs)
+
+
 class _CommandBuilder:
     """``click`` command builder.
 
@@ -206,6 +310,8 @@ class _CommandBuilder:
         sig: callback signature
         hints: callback type-hints
         existing: existing parameters
+        kwargs_single: single-value parameters added from callback kwargs
+        kwargs_multiple: multiple-value parameters added from callback kwargs
     """
 
     def __init__(self, fn: t.Callable, command_kwargs: t.Dict[str, t.Any] = None):
@@ -218,6 +324,8 @@ class _CommandBuilder:
         self.sig = None  # type: inspect.Signature
         self.hints = None  # type: t.Dict[str, t.Any]
         self.existing = set()  # type: t.Set[str]
+        self.kwargs_single = []  # type: t.List[str]
+        self.kwargs_multiple = []  # type: t.List[str]
 
     def _inspect_fn(self):
         """Inspect callback docstring and type-hints."""
@@ -237,6 +345,7 @@ class _CommandBuilder:
                 ("\n\n" if self.doc.blank_after_short_description else "\n") +
                 (self.doc.long_description or "")
             )
+        kwargs["cls"] = _get_command_class(kwargs.get("cls") or click.Command)
         command_decorator = click.command(**kwargs)
         self.decorators.append(command_decorator)
 
@@ -255,36 +364,58 @@ class _CommandBuilder:
         """Add parameters from callback kwargs."""
         if all(p.kind != p.VAR_KEYWORD for p in self.sig.parameters.values()):
             return
-        for name, param_doc in self.param_docs:
-            if name in self.existing:
+        for name, param_doc in self.param_docs.items():
+            if name in self.existing or name in self.sig.parameters:
                 continue
-            param = self.sig.parameters.get(name)
-            if param and param.kind != param.VAR_KEYWORD:
-                continue
-            param_type = _get_param_type_from_str(param_doc.type_name)
-            decorator = click.option(
-                "--" + name.replace("_", "-"),
-                help=param_doc.description,
-                type=param_type,
+            param_args, param_type = _get_param_type_from_str(
+                param_doc.type_name, param_doc
             )
+            kind = inspect.Parameter.KEYWORD_ONLY
+            param = inspect.Parameter(name, kind, default=None)
+            decorator = _get_param_decorator(param, param_args, param_type, param_doc)
             self.decorators.append(decorator)
+            if param_args is _ParamArgs.multiple:
+                self.kwargs_multiple.append(name)
+            else:
+                self.kwargs_single.append(name)
+
+    def _build_callback(self) -> t.Callable:
+        """Build command callback, mapping parsed parameters to arguments."""
+        positional = []
+        var_positional = None
+        positional_only = False
+        for param in self.sig.parameters.values():
+            if param.kind == param.VAR_POSITIONAL:
+                var_positional = param.name
+            elif param.kind in (param.POSITIONAL_ONLY, param.POSITIONAL_OR_KEYWORD):
+                positional.append(param.name)
+                is_positional_only = param.kind == param.POSITIONAL_ONLY
+                positional_only = positional_only or is_positional_only
+
+        callback = self.fn
+        if var_positional is not None:
+            callback = ft.partial(
+                _call_var_args, self.fn, tuple(positional), var_positional
+            )
+        elif positional_only:
+            callback = ft.partial(_call_positional, self.fn, tuple(positional))
+        if self.kwargs_single or self.kwargs_multiple:
+            callback = ft.partial(
+                _drop_unset_kwargs,
+                callback,
+                tuple(self.kwargs_single),
+                tuple(self.kwargs_multiple),
+            )
+        if callback is not self.fn:
+            ft.update_wrapper(callback, self.fn)
+        return callback
 
     def _finalise(self):
         """Construct command from defined decorators."""
-        fn = self.fn
-        params = self.sig.parameters.values()
-        vp_params = [p for p in params if p.kind == p.VAR_POSITIONAL]
-        if vp_params:
-            vp_param: inspect.Parameter = vp_params[0]
-
-            @ft.wraps(self.fn)
-            def fn(*args, **kwargs):
-                vargs = kwargs.pop(vp_param.name)
-                return self.fn(*args, *vargs, **kwargs)
-
-        self.command = fn
+        self.command = self.fn
         for decorator in self.decorators:
             self.command = decorator(self.command)
+        self.command.callback = self._build_callback()
 
     def build(self):
         """Build command."""
@@ -4,12 +4,75 @@ import click_from_docstring as tscr
 import pytest
 # from unittest import mock
 from click import testing as click_testing
+import sys
 import math
+import pickle
 import typing as t
+import multiprocessing
+import concurrent.futures
+
+import click
 import datetime
 import uuid
 
 
+@tscr.command()
+def _pickle_prod(*values: float, scale: float = 1.0):
+    """Take scaled product of floats.
+
+    Args:
+        values: values to multiply
+        scale: product scale
+    """
+
+    prod = scale
+    for value in values:
+        prod *= value
+    print(prod)
+
+
+def _pickle_greet(name, **kwargs):
+    """Greet someone.
+
+    Args:
+        name (str): person to greet
+        greeting (str): greeting to use
+    """
+
+    print(kwargs.get("greeting", "Hello") + ", " + name)
+
+
+_pickle_greet_command = tscr.command()(_pickle_greet)
+
+
+class _PickleCommand(click.Command):
+    pass
+
+
+@tscr.command(cls=_PickleCommand)
+def _pickle_shout(words: t.List[str]):
+    """Shout words.
+
+    Args:
+        words: words to shout
+    """
+
+    print(" ".join(words).upper())
+
+
+_pickle_greet_custom = tscr.command(cls=_PickleCommand)(_pickle_greet)
+
+
+@click.command()
+def _pickle_plain():
+    pass
+
+
+def _invoke_in_worker(command, args):
+    """Invoke command, returning its output."""
+    return click_testing.CliRunner().invoke(command, args).stdout
+
+
 class TestSpam:
     @pytest.fixture
     def context_settings(self):
@@ -336,3 +399,203 @@ class TestUUID:
         print(res.stdout)
         assert not res.exit_code
         assert int(res.stdout) == exp
+
+
+class TestKwargs:
+    @pytest.fixture
+    def command(self):
+        """An example command with keyword arguments."""
+        @tscr.command()
+        def greet(name, *, loud=False, **kwargs):
+            """Greet someone.
+
+            Args:
+                name (str): person to greet
+                loud (bool): shout greeting
+                kwargs: extra options
+                greeting (str): greeting to use
+                times (int): number of greetings
+                also (list[str]): others to greet
+            """
+
+            names = (name,) + kwargs.pop("also", ())
+            msg = kwargs.pop("greeting", "Hello") + ", " + " and ".join(names)
+            for _ in range(kwargs.pop("times", 1)):
+                print(msg.upper() if loud else msg)
+            assert not kwargs
+        return greet
+
+    @pytest.fixture
+    def runner(self):
+        """``click`` CLI test runner."""
+        return click_testing.CliRunner()
+
+    def test_help(self, runner, command):
+        res = runner.invoke(command, ["--help"])
+        assert not res.exit_code
+        assert res.stdout == (
+            "Usage: greet [OPTIONS] NAME\n"
+            "\n"
+            "  Greet someone.\n"
+            "\n"
+            "Options:\n"
+            "  --loud / --no-loud  shout greeting\n"
+            "  --greeting TEXT     greeting to use\n"
+            "  --times INTEGER     number of greetings\n"
+            "  --also TEXT         others to greet\n"
+            "  --help              Show this message and exit.\n"
+        )
+
+    def test_no_kwargs(self, runner, command):
+        res = runner.invoke(command, ["Brian"])
+        assert not res.exit_code
+        assert res.stdout == "Hello, Brian\n"
+
+    def test_kwargs(self, runner, command):
+        args = ["Brian", "--loud", "--greeting", "Hi", "--times", "2"]
+        res = runner.invoke(command, args)
+        assert not res.exit_code
+        assert res.stdout == "HI, BRIAN\nHI, BRIAN\n"
+
+    def test_multiple(self, runner, command):
+        res = runner.invoke(command, ["Brian", "--also", "Judith", "--also", "Reg"])
+        assert not res.exit_code
+        assert res.stdout == "Hello, Brian and Judith and Reg\n"
+
+    def test_callback(self, command, capsys):
+        command.callback(name="Brian")
+        assert capsys.readouterr().out == "Hello, Brian\n"
+
+
+class TestPositional:
+    @pytest.fixture
+    def _cmd0(self):
+        @tscr.command()
+        def join(sep, *words, end=""):
+            """Join words.
+
+            Args:
+                sep (str): word separator
+                words (str): words to join
+                end (str): appended to result
+            """
+
+            print(sep.join(words) + end)
+        return join
+
+    @pytest.fixture
+    def _cmd1(self):
+        if sys.version_info < (3, 8):
+            pytest.skip("positional-only parameters require Python 3.8")
+        namespace = {}
+        exec(
+            "def join(sep, words, /, end=''):\n"
+            "    \"\"\"Join words.\n"
+            "\n"
+            "    Args:\n"
+            "        sep (str): word separator\n"
+            "        words (list[str]): words to join\n"
+            "        end (str): appended to result\n"
+            "    \"\"\"\n"
+            "\n"
+            "    print(sep.join(words) + end)\n",
+            namespace,
+        )
+        return tscr.command()(namespace["join"])
+
+    @pytest.fixture(params=[pytest.param(j, id="cmd%d" % j) for j in range(2)])
+    def command(self, request, _cmd0, _cmd1):
+        """An example command with positionally-passed parameters."""
+        return [_cmd0, _cmd1][request.param]
+
+    @pytest.fixture
+    def runner(self):
+        """``click`` CLI test runner."""
+        return click_testing.CliRunner()
+
+    def test_help(self, runner, command):
+        res = runner.invoke(command, ["--help"])
+        assert not res.exit_code
+        assert res.stdout == (
+            "Usage: join [OPTIONS] SEP [WORDS]...\n"
+            "\n"
+            "  Join words.\n"
+            "\n"
+            "Options:\n"
+            "  --end TEXT  appended to result\n"
+            "  --help      Show this message and exit.\n"
+        )
+
+    def test_words(self, runner, command):
+        res = runner.invoke(command, ["-", "spam", "eggs", "--end", "!"])
+        assert not res.exit_code
+        assert res.stdout == "spam-eggs!\n"
+
+    def test_no_words(self, runner, command):
+        res = runner.invoke(command, ["-"])
+        assert not res.exit_code
+        assert res.stdout == "\n"
+
+
+class TestPickle:
+    @pytest.fixture
+    def runner(self):
+        """``click`` CLI test runner."""
+        return click_testing.CliRunner()
+
+    def test_decorated(self, runner):
+        command = pickle.loads(pickle.dumps(_pickle_prod))
+        assert command is _pickle_prod
+        res = runner.invoke(command, ["42.0", "3", "--scale", "2"])
+        assert not res.exit_code
+        assert float(res.stdout) == pytest.approx(252.0)
+
+    def test_wrapped(self, runner):
+        command = pickle.loads(pickle.dumps(_pickle_greet_command))
+        assert command is not _pickle_greet_command
+        assert command.callback.__wrapped__ is _pickle_greet
+        res = runner.invoke(command, ["Brian", "--greeting", "Hi"])
+        assert not res.exit_code
+        assert res.stdout == "Hi, Brian\n"
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    def test_custom_class(self, runner, protocol):
+        shout = pickle.loads(pickle.dumps(_pickle_shout, protocol))
+        assert shout is _pickle_shout
+        greet = pickle.loads(pickle.dumps(_pickle_greet_custom, protocol))
+        assert greet is not _pickle_greet_custom
+        assert isinstance(greet, _PickleCommand)
+        res = runner.invoke(greet, ["Brian", "--greeting", "Hi"])
+        assert not res.exit_code
+        assert res.stdout == "Hi, Brian\n"
+
+    def test_plain_click(self):
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(_pickle_plain)
+
+    def test_local(self):
+        @tscr.command()
+        def spam(eggs):
+            """Print spam.
+
+            Args:
+                eggs (str): to go with your spam
+            """
+
+            print("spam", eggs)
+
+        with pytest.raises((pickle.PicklingError, AttributeError), match="local"):
+            pickle.dumps(spam)
+
+    def test_process_pool(self):
+        context = multiprocessing.get_context("spawn")
+        executor = concurrent.futures.ProcessPoolExecutor(1, mp_context=context)
+        with executor:
+            prod = executor.submit(_invoke_in_worker, _pickle_prod, ["2", "3"])
+            greet = executor.submit(
+                _invoke_in_worker, _pickle_greet_custom, ["Brian"]
+            )
+            shout = executor.submit(_invoke_in_worker, _pickle_shout, ["spam"])
+            assert float(prod.result()) == pytest.approx(6.0)
+            assert greet.result() == "Hello, Brian\n"
+            assert shout.result() == "SPAM\n"